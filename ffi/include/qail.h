@@ -12,6 +12,9 @@
 #ifndef QAIL_H
 #define QAIL_H
 
+#include <stddef.h>
+#include <stdint.h>
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -66,6 +69,58 @@ const char* qail_last_error(void);
  */
 void qail_free(char* ptr);
 
+/**
+ * Free bytes returned by qail_encode_* functions.
+ * Safe to call with NULL.
+ *
+ * @param ptr  Pointer returned via out_ptr
+ * @param len  Length returned via out_len
+ */
+void qail_free_bytes(uint8_t* ptr, size_t len);
+
+/**
+ * Encode a GET query to PostgreSQL wire protocol bytes.
+ *
+ * @param table    Table name (UTF-8)
+ * @param columns  Comma-separated columns, or "*" for all
+ * @param limit    Row limit (-1 for no limit)
+ * @param out_ptr  Receives pointer to encoded bytes (free with qail_free_bytes)
+ * @param out_len  Receives byte length
+ * @return         0 on success, non-zero on error
+ */
+int32_t qail_encode_get(const char* table, const char* columns, int64_t limit,
+                        uint8_t** out_ptr, size_t* out_len);
+
+/**
+ * Encode a batch of GET queries for pipeline execution (single round-trip).
+ *
+ * @param tables   Array of table names
+ * @param columns  Array of column specs (comma-separated or "*")
+ * @param limits   Array of limits (-1 for no limit)
+ * @param count    Number of queries
+ * @param out_ptr  Receives pointer to encoded bytes (free with qail_free_bytes)
+ * @param out_len  Receives byte length
+ * @return         0 on success, non-zero on error
+ */
+int32_t qail_encode_batch_get(const char* const* tables, const char* const* columns,
+                              const int64_t* limits, size_t count,
+                              uint8_t** out_ptr, size_t* out_len);
+
+/**
+ * Encode a UNIFORM batch of identical GET queries.
+ * Encode ONCE, send the same bytes MANY times.
+ *
+ * @param table    Table name (UTF-8)
+ * @param columns  Comma-separated columns, or "*" for all
+ * @param limit    Row limit (-1 for no limit)
+ * @param count    Number of queries in batch
+ * @param out_ptr  Receives pointer to encoded bytes (free with qail_free_bytes)
+ * @param out_len  Receives byte length
+ * @return         0 on success, non-zero on error
+ */
+int32_t qail_encode_uniform_batch(const char* table, const char* columns, int64_t limit,
+                                  size_t count, uint8_t** out_ptr, size_t* out_len);
+
 /**
  * Get QAIL library version.
  * 
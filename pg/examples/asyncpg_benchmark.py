@@ -3,6 +3,11 @@
 Python asyncpg Pipelining Benchmark
 Compare with QAIL-PG query_pipeline()
 
+Single direct connection (no pool, so no per-release reset query).
+
+Runs under uvloop when installed (pip install uvloop), like asyncpg's
+own benchmarks; falls back to the stdlib event loop.
+
 Run: STAGING_DB_PASSWORD="xxx" python3 asyncpg_benchmark.py
 """
 
@@ -11,6 +16,11 @@ import os
 import time
 from typing import List
 
+try:
+    import uvloop  # Optional: pip install uvloop
+except ImportError:
+    uvloop = None
+
 QUERIES_PER_BATCH = 1000
 BATCHES = 1000
 
@@ -27,7 +37,9 @@ async def main():
         port=5444,
         user="sailtix",
         password=password,
-        database="swb-staging"
+        database="swb-staging",
+        statement_cache_size=1024,
+        server_settings={'client_min_messages': 'error', 'jit': 'off'},
     )
     
     total_queries = BATCHES * QUERIES_PER_BATCH
@@ -41,6 +53,9 @@ async def main():
     # Warmup
     await conn.execute("SELECT 1")
     
+    # Prepare statement ONCE
+    stmt = await conn.prepare("SELECT id, name FROM harbors LIMIT $1")
+    
     # ===== PIPELINED QUERIES =====
     print("📊 Running pipeline benchmark...")
     
@@ -51,9 +66,6 @@ async def main():
         if batch % 100 == 0:
             print(f"   Batch {batch}/{BATCHES}")
         
-        # asyncpg doesn't have explicit pipeline(), but we can batch via prepared statements
-        stmt = await conn.prepare("SELECT id, name FROM harbors LIMIT $1")
-        
         # Execute batch of queries
         for i in range(1, QUERIES_PER_BATCH + 1):
             limit = (i % 10) + 1
@@ -88,4 +100,7 @@ async def main():
     await conn.close()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
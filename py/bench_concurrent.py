@@ -0,0 +1,83 @@
+"""
+Concurrent-mode runners shared by bench_sequential_fair.py and
+bench_ipc_sequential.py, so both scripts time the same concurrent baselines.
+
+Each runner does a 100-query warmup and returns the elapsed seconds for
+`total` queries; the calling script turns that into its own result row.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+WARMUP_QUERIES = 100
+
+async def run_concurrent(fetchers, total):
+    """Run `total` queries as rounds of len(fetchers) gathered calls."""
+    width = len(fetchers)
+    for chunk_start in range(0, total, width):
+        n = min(width, total - chunk_start)
+        await asyncio.gather(*(fetch() for fetch in fetchers[:n]))
+
+async def time_asyncpg_concurrent(connect_kwargs: dict, sql: str, concurrency: int, total: int):
+    """asyncpg over `concurrency` pooled connections; None if asyncpg is missing"""
+    try:
+        import asyncpg
+    except ImportError:
+        print("  asyncpg not installed, skipping")
+        return None
+    
+    # A single asyncpg connection serializes, so concurrency needs a pool
+    pool = await asyncpg.create_pool(
+        min_size=concurrency,
+        max_size=concurrency,
+        **connect_kwargs
+    )
+    # Acquire once so no reset query runs inside the timed region
+    conns = [await pool.acquire() for _ in range(concurrency)]
+    fetchers = [(await c.prepare(sql)).fetch for c in conns]
+    
+    # Warmup
+    await run_concurrent(fetchers, WARMUP_QUERIES)
+    
+    # Benchmark
+    start = time.perf_counter()
+    await run_concurrent(fetchers, total)
+    elapsed = time.perf_counter() - start
+    
+    for c in conns:
+        await pool.release(c)
+    await pool.close()
+    return elapsed
+
+async def time_pyo3_concurrent(connect_args: tuple, make_cmd, concurrency: int, total: int):
+    """qail PyO3 PgDriver with `concurrency` connections, one thread each"""
+    from qail import PgDriver
+    
+    def connect(_):
+        return PgDriver.connect(*connect_args)
+    
+    def run_queries(driver, n):
+        for _ in range(n):
+            rows = driver.fetch_all(make_cmd())
+    
+    # Split queries evenly, one sync driver per thread (GIL released in Rust)
+    def run_all(drivers, n_total):
+        base, extra = divmod(n_total, len(drivers))
+        return asyncio.gather(*(
+            loop.run_in_executor(executor, run_queries, d, base + (i < extra))
+            for i, d in enumerate(drivers)
+        ))
+    
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="qail") as executor:
+        drivers = list(executor.map(connect, range(concurrency)))
+        
+        # Warmup
+        await run_all(drivers, WARMUP_QUERIES)
+        
+        # Benchmark
+        start = time.perf_counter()
+        await run_all(drivers, total)
+        elapsed = time.perf_counter() - start
+    return elapsed
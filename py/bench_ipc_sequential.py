@@ -3,6 +3,8 @@ Benchmark IPC daemon mode for sequential queries.
 
 Tests the qail-daemon Unix socket approach for sequential queries.
 Requires qail-daemon to be running: cargo run -p qail-daemon
+
+Async benches run under uvloop when installed (pip install uvloop).
 """
 
 import asyncio
@@ -11,47 +13,148 @@ import struct
 import json
 import time
 
+from bench_concurrent import time_asyncpg_concurrent, time_pyo3_concurrent
+
+try:
+    import uvloop  # Optional: pip install uvloop
+except ImportError:
+    uvloop = None
+
 SOCKET_PATH = "/tmp/qail.sock"
 DB_HOST = 'localhost'
 DB_PORT = 5432
 DB_USER = 'orion'
 DB_NAME = 'swb_staging_local'
 
+# asyncpg connection options: big statement cache, no notice traffic, no JIT
+# (same as bench_sequential_fair.py)
+ASYNCPG_OPTIONS = dict(
+    statement_cache_size=1024,
+    server_settings={'client_min_messages': 'error', 'jit': 'off'},
+)
+
 NUM_QUERIES = 5000
+CONCURRENCY = 32  # In-flight queries in concurrent / pipelined mode
+RECV_SIZE = 65536
+SOCK_BUF_SIZE = 131072  # Kernel send/receive buffer per direction
+
+_U32 = struct.Struct('>I')  # Frame length prefix
+
+# serde writes the enum tag first, so a response's status is its prefix
+_ERROR_PREFIX = b'{"type":"Error"'
+
+
+def _encode_request(request: dict) -> bytes:
+    """Serialize a daemon request (compact JSON, as serde_json emits)."""
+    return json.dumps(request, separators=(',', ':')).encode('utf-8')
+
+
+def _is_error(resp: memoryview) -> bool:
+    return resp[:len(_ERROR_PREFIX)] == _ERROR_PREFIX
+
+
+def _frame(data: bytes) -> bytes:
+    """Length-prefix a serialized request once, for IpcClient.send_raw."""
+    return _U32.pack(len(data)) + data
+
+
+# Requests are constant for a run: serialize and frame them once at load
+_CONNECT_REQ = _frame(_encode_request({
+    "type": "Connect",
+    "host": DB_HOST,
+    "port": DB_PORT,
+    "user": DB_USER,
+    "database": DB_NAME,
+    "password": None
+}))
+_CLOSE_REQ = _frame(_encode_request({"type": "Close"}))
+_QUERY_REQ = _frame(_encode_request({
+    "type": "Get",
+    "table": "destinations",
+    "columns": ["id", "name", "slug", "is_active"],
+    "filter": None,
+    "limit": 10
+}))
+
 
 class IpcClient:
     """Simple IPC client for qail-daemon"""
     
     def __init__(self, sock):
         self.sock = sock
+        # Receive buffer, reused across requests (recv_into, no per-call bytes)
+        self._buf = bytearray(RECV_SIZE)
+        self._mv = memoryview(self._buf)
+        self._start = 0  # Next unread response byte
+        self._end = 0    # End of received data
     
     @classmethod
     def connect(cls):
         """Connect to qail-daemon via Unix socket"""
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Larger kernel buffers: fewer partial reads per response and
+        # room for a whole pipelined batch in one write
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCK_BUF_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCK_BUF_SIZE)
         sock.connect(SOCKET_PATH)
+        # Plain blocking mode: recv/send go straight to the syscall
+        sock.settimeout(None)
         return cls(sock)
     
-    def send_request(self, request: dict) -> dict:
-        """Send request and receive response"""
-        data = json.dumps(request).encode('utf-8')
-        length = struct.pack('>I', len(data))
-        self.sock.sendall(length + data)
+    def send_raw(self, frame: bytes) -> memoryview:
+        """Send a pre-framed request (see _frame) and return the raw response body"""
+        self.sock.sendall(frame)
+        return self._read_response()
+    
+    def send_batch(self, frames: list[bytes]) -> list[bytes]:
+        """Pipeline pre-framed requests: write all, then read one response each.
         
-        # Read response
-        len_bytes = self.sock.recv(4)
-        resp_len = struct.unpack('>I', len_bytes)[0]
-        resp_data = b''
-        while len(resp_data) < resp_len:
-            resp_data += self.sock.recv(resp_len - len(resp_data))
+        The daemon answers requests in order on a connection, so N requests
+        cost one write and about one read instead of N round-trips.
+        """
+        self.sock.sendall(b''.join(frames))
+        # Copy out: later reads may compact the receive buffer
+        return [bytes(self._read_response()) for _ in frames]
+    
+    def _read_response(self) -> memoryview:
+        """Read one length-prefixed response (usually a single recv).
         
-        return json.loads(resp_data)
+        Returns a view into the receive buffer, valid until the next request.
+        """
+        if self._start == self._end:
+            self._start = self._end = 0
+        while self._end - self._start < 4:
+            self._recv(4)
+        length = 4 + _U32.unpack_from(self._buf, self._start)[0]
+        while self._end - self._start < length:
+            self._recv(length)
+        start = self._start
+        self._start = start + length
+        return self._mv[start + 4:start + length]
+    
+    def _recv(self, need: int):
+        """recv_into the buffer, first making room for `need` unread bytes."""
+        buf = self._buf
+        if self._start + need > len(buf):
+            # Compact (or grow) so the unread bytes start at offset 0
+            unread = buf[self._start:self._end]
+            if need > len(buf):
+                buf = bytearray(max(need, 2 * len(buf)))
+                self._buf = buf
+                self._mv = memoryview(buf)
+            buf[:len(unread)] = unread
+            self._start = 0
+            self._end = len(unread)
+        n = self.sock.recv_into(self._mv[self._end:])
+        if not n:
+            raise ConnectionError("qail-daemon closed the connection")
+        self._end += n
     
     def close(self):
         self.sock.close()
 
-def bench_ipc_sequential():
-    """Benchmark IPC daemon with sequential queries"""
+def _open_ipc_client():
+    """Connect to qail-daemon and its database; None (after printing) on failure"""
     try:
         client = IpcClient.connect()
     except Exception as e:
@@ -60,61 +163,97 @@ def bench_ipc_sequential():
         return None
     
     # Connect to database
-    resp = client.send_request({
-        "type": "Connect",
-        "host": DB_HOST,
-        "port": DB_PORT,
-        "user": DB_USER,
-        "database": DB_NAME,
-        "password": None
-    })
-    
-    if resp.get("type") == "Error":
-        print(f"  Connection error: {resp.get('message')}")
+    resp = client.send_raw(_CONNECT_REQ)
+    if _is_error(resp):
+        print(f"  Connection error: {json.loads(bytes(resp)).get('message')}")
+        return None
+    return client
+
+def bench_ipc_sequential():
+    """Benchmark IPC daemon with sequential queries"""
+    client = _open_ipc_client()
+    if client is None:
         return None
     
-    # Build query request
-    query = {
-        "type": "Get",
-        "table": "destinations",
-        "columns": ["id", "name", "slug", "is_active"],
-        "filter": None,
-        "limit": 10
-    }
+    # Pre-framed query: the hot loop does no JSON or framing work
+    query = _QUERY_REQ
     
     # Warmup
     for _ in range(100):
-        resp = client.send_request(query)
+        resp = client.send_raw(query)
+    if _is_error(resp):
+        print(f"  Query error: {json.loads(bytes(resp)).get('message')}")
+        return None
     
     # Benchmark
     start = time.perf_counter()
     for _ in range(NUM_QUERIES):
-        resp = client.send_request(query)
+        resp = client.send_raw(query)
     elapsed = time.perf_counter() - start
     
-    client.send_request({"type": "Close"})
+    if _is_error(resp):
+        print(f"  Query error: {json.loads(bytes(resp)).get('message')}")
+        return None
+    
+    client.send_raw(_CLOSE_REQ)
     client.close()
     
     qps = NUM_QUERIES / elapsed
     us_per_op = (elapsed / NUM_QUERIES) * 1_000_000
     return ("IPC daemon", qps, elapsed, us_per_op)
 
+def bench_ipc_pipelined():
+    """Benchmark IPC daemon with CONCURRENCY requests pipelined per write"""
+    client = _open_ipc_client()
+    if client is None:
+        return None
+    
+    query = _QUERY_REQ
+    
+    def run(total):
+        for chunk_start in range(0, total, CONCURRENCY):
+            n = min(CONCURRENCY, total - chunk_start)
+            resps = client.send_batch([query] * n)
+        return resps[-1]
+    
+    # Warmup
+    resp = run(100)
+    if _is_error(resp):
+        print(f"  Query error: {json.loads(resp).get('message')}")
+        return None
+    
+    # Benchmark
+    start = time.perf_counter()
+    run(NUM_QUERIES)
+    elapsed = time.perf_counter() - start
+    
+    client.send_raw(_CLOSE_REQ)
+    client.close()
+    
+    qps = NUM_QUERIES / elapsed
+    us_per_op = (elapsed / NUM_QUERIES) * 1_000_000
+    return (f"IPC pipelined x{CONCURRENCY}", qps, elapsed, us_per_op)
+
 async def bench_asyncpg():
     """Baseline asyncpg"""
     import asyncpg
     
     conn = await asyncpg.connect(
-        host=DB_HOST, port=DB_PORT, user=DB_USER, database=DB_NAME
+        host=DB_HOST, port=DB_PORT, user=DB_USER, database=DB_NAME,
+        **ASYNCPG_OPTIONS
     )
     
-    sql = "SELECT id, name, slug, is_active FROM destinations ORDER BY name LIMIT 10"
+    # Prepare once, like the PyO3 driver holding a built command
+    stmt = await conn.prepare(
+        "SELECT id, name, slug, is_active FROM destinations ORDER BY name LIMIT 10"
+    )
     
     for _ in range(100):
-        await conn.fetch(sql)
+        await stmt.fetch()
     
     start = time.perf_counter()
     for _ in range(NUM_QUERIES):
-        await conn.fetch(sql)
+        rows = await stmt.fetch()
     elapsed = time.perf_counter() - start
     
     await conn.close()
@@ -123,13 +262,11 @@ async def bench_asyncpg():
     us_per_op = (elapsed / NUM_QUERIES) * 1_000_000
     return ("asyncpg", qps, elapsed, us_per_op)
 
-async def bench_qail_pyo3():
-    """PyO3 driver"""
+def bench_qail_pyo3():
+    """PyO3 driver, called directly: fetch_all releases the GIL itself"""
     from qail import PgDriver, Qail
     
-    driver = await asyncio.to_thread(
-        PgDriver.connect, DB_HOST, DB_PORT, DB_USER, DB_NAME, ""
-    )
+    driver = PgDriver.connect(DB_HOST, DB_PORT, DB_USER, DB_NAME, "")
     
     cmd = (Qail.get("destinations")
            .columns(["id", "name", "slug", "is_active"])
@@ -137,21 +274,54 @@ async def bench_qail_pyo3():
            .limit(10))
     
     for _ in range(100):
-        await asyncio.to_thread(driver.fetch_all, cmd)
+        driver.fetch_all(cmd)
     
     start = time.perf_counter()
     for _ in range(NUM_QUERIES):
-        await asyncio.to_thread(driver.fetch_all, cmd)
+        driver.fetch_all(cmd)
     elapsed = time.perf_counter() - start
     
     qps = NUM_QUERIES / elapsed
     us_per_op = (elapsed / NUM_QUERIES) * 1_000_000
     return ("PyO3 driver", qps, elapsed, us_per_op)
 
+async def bench_asyncpg_concurrent():
+    """asyncpg with CONCURRENCY pooled connections, gathered per round"""
+    elapsed = await time_asyncpg_concurrent(
+        dict(host=DB_HOST, port=DB_PORT, user=DB_USER, database=DB_NAME, **ASYNCPG_OPTIONS),
+        "SELECT id, name, slug, is_active FROM destinations ORDER BY name LIMIT 10",
+        CONCURRENCY, NUM_QUERIES,
+    )
+    if elapsed is None:
+        return None
+    
+    qps = NUM_QUERIES / elapsed
+    us_per_op = (elapsed / NUM_QUERIES) * 1_000_000
+    return (f"asyncpg x{CONCURRENCY}", qps, elapsed, us_per_op)
+
+async def bench_qail_pyo3_concurrent():
+    """PyO3 driver with CONCURRENCY connections, one thread each"""
+    from qail import Qail
+    
+    def make_cmd():
+        return (Qail.get("destinations")
+                .columns(["id", "name", "slug", "is_active"])
+                .order_by("name")
+                .limit(10))
+    
+    elapsed = await time_pyo3_concurrent(
+        (DB_HOST, DB_PORT, DB_USER, DB_NAME, ""), make_cmd, CONCURRENCY, NUM_QUERIES,
+    )
+    
+    qps = NUM_QUERIES / elapsed
+    us_per_op = (elapsed / NUM_QUERIES) * 1_000_000
+    return (f"PyO3 driver x{CONCURRENCY}", qps, elapsed, us_per_op)
+
 async def main():
     print("=" * 60)
     print("Sequential Query Benchmark - Including IPC Daemon")
     print(f"Queries: {NUM_QUERIES} sequential")
+    print(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
     print("=" * 60)
     print()
     
@@ -163,7 +333,7 @@ async def main():
     print(f"  {r[0]}: {r[1]:,.0f} q/s ({r[3]:.2f} µs/query)")
     
     print("Testing PyO3 driver...")
-    r = await bench_qail_pyo3()
+    r = bench_qail_pyo3()
     results.append(r)
     print(f"  {r[0]}: {r[1]:,.0f} q/s ({r[3]:.2f} µs/query)")
     
@@ -173,16 +343,29 @@ async def main():
         results.append(r)
         print(f"  {r[0]}: {r[1]:,.0f} q/s ({r[3]:.2f} µs/query)")
     
+    print(f"Testing concurrent mode ({CONCURRENCY} in flight)...")
+    for r in (
+        await bench_asyncpg_concurrent(),
+        await bench_qail_pyo3_concurrent(),
+        bench_ipc_pipelined(),
+    ):
+        if r:
+            results.append(r)
+            print(f"  {r[0]}: {r[1]:,.0f} q/s ({r[3]:.2f} µs/query)")
+    
     print()
     print("=" * 60)
-    print("RESULTS (Sequential Mode)")
+    print("RESULTS")
     print("=" * 60)
     
     if results:
         baseline = results[0][1]  # asyncpg
         for name, qps, elapsed, us in sorted(results, key=lambda x: -x[1]):
             ratio = qps / baseline
-            print(f"{name:20s} {qps:>10,.0f} q/s  {us:>7.2f} µs/query  ({ratio:.2f}x vs asyncpg)")
+            print(f"{name:24s} {qps:>10,.0f} q/s  {us:>7.2f} µs/query  ({ratio:.2f}x vs asyncpg)")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -6,10 +6,31 @@ Drivers tested:
 1. qail PyO3 (PgDriver) - Rust Tokio embedded
 2. qail AsyncPgDriver (pure Python + PyO3 encoder)
 3. asyncpg - baseline external driver
+
+Each driver also runs in CONCURRENCY mode: CONCURRENCY connections,
+queries issued in rounds of asyncio.gather (threads for the sync PyO3
+driver).
+
+Sequential asyncpg uses one direct connection, never a pool: pool release
+runs a reset query (a full round-trip). The concurrent run acquires its
+pool connections once and releases them after timing. Pooled ports must
+pass asyncpg.create_pool(..., setup=None, init=None) and override
+Connection._reset to a no-op. QAIL drivers have no implicit reset.
+
+All async drivers run under uvloop when installed (pip install uvloop);
+the event loop in use is printed in the header.
 """
 
 import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_concurrent import run_concurrent, time_asyncpg_concurrent, time_pyo3_concurrent
+
+try:
+    import uvloop  # Optional: pip install uvloop
+except ImportError:
+    uvloop = None
 
 # Database config - use existing local database
 DB_HOST = 'localhost'
@@ -22,7 +43,15 @@ DB_PASS = None
 # Simple SELECT from destinations table (4 rows)
 QUERY_SQL = "SELECT id, name, slug, is_active FROM destinations ORDER BY name LIMIT 10"
 
+# asyncpg connection options: big statement cache, no notice traffic, no JIT
+ASYNCPG_OPTIONS = dict(
+    statement_cache_size=1024,
+    server_settings={'client_min_messages': 'error', 'jit': 'off'},
+)
+
 NUM_QUERIES = 5000  # Sequential queries to run (repeat same query)
+PIPELINE_DEPTH = 256  # Queries per round-trip in pipelined mode
+CONCURRENCY = 32  # Connections / in-flight queries in concurrent mode
 
 async def bench_asyncpg():
     """Benchmark asyncpg (external driver)"""
@@ -36,17 +65,21 @@ async def bench_asyncpg():
         host=DB_HOST,
         port=DB_PORT,
         user=DB_USER,
-        database=DB_NAME
+        database=DB_NAME,
+        **ASYNCPG_OPTIONS
     )
     
+    # Prepare once, like the qail drivers holding a built command
+    stmt = await conn.prepare(QUERY_SQL)
+    
     # Warmup
     for _ in range(100):
-        await conn.fetch(QUERY_SQL)
+        await stmt.fetch()
     
     # Benchmark
     start = time.perf_counter()
     for _ in range(NUM_QUERIES):
-        rows = await conn.fetch(QUERY_SQL)
+        rows = await stmt.fetch()
     elapsed = time.perf_counter() - start
     
     await conn.close()
@@ -62,11 +95,6 @@ async def bench_qail_pyo3():
         print(f"  qail not installed, skipping PyO3 test: {e}")
         return None
     
-    driver = await asyncio.to_thread(
-        PgDriver.connect, 
-        DB_HOST, DB_PORT, DB_USER, DB_NAME, ""  # Empty password for trust auth
-    )
-    
     # Build the same query using Qail
     def make_cmd():
         return (Qail.get("destinations")
@@ -74,15 +102,27 @@ async def bench_qail_pyo3():
                 .order_by("name")
                 .limit(10))
     
-    # Warmup
-    for _ in range(100):
-        await asyncio.to_thread(driver.fetch_all, make_cmd())
+    # PgDriver is sync: run whole loops on one dedicated thread
+    # instead of one asyncio.to_thread hop per query
+    def run_queries(n):
+        for _ in range(n):
+            rows = driver.fetch_all(make_cmd())
     
-    # Benchmark - sequential queries
-    start = time.perf_counter()
-    for _ in range(NUM_QUERIES):
-        rows = await asyncio.to_thread(driver.fetch_all, make_cmd())
-    elapsed = time.perf_counter() - start
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="qail") as executor:
+        driver = await loop.run_in_executor(
+            executor,
+            PgDriver.connect,
+            DB_HOST, DB_PORT, DB_USER, DB_NAME, ""  # Empty password for trust auth
+        )
+        
+        # Warmup
+        await loop.run_in_executor(executor, run_queries, 100)
+        
+        # Benchmark - sequential queries
+        start = time.perf_counter()
+        await loop.run_in_executor(executor, run_queries, NUM_QUERIES)
+        elapsed = time.perf_counter() - start
     
     qps = NUM_QUERIES / elapsed
     return ("qail PyO3", qps, elapsed)
@@ -125,12 +165,128 @@ async def bench_qail_async():
     qps = NUM_QUERIES / elapsed
     return ("qail AsyncPgDriver", qps, elapsed)
 
+async def bench_qail_async_pipelined():
+    """Benchmark qail AsyncPgDriver with PIPELINE_DEPTH queries per round-trip"""
+    try:
+        from qail import AsyncPgDriver, Qail
+    except ImportError as e:
+        print(f"  qail AsyncPgDriver not available, skipping: {e}")
+        return None
+    
+    try:
+        driver = await AsyncPgDriver.connect(
+            DB_HOST, DB_PORT, DB_USER, DB_NAME, DB_PASS
+        )
+    except Exception as e:
+        print(f"  AsyncPgDriver connection failed: {e}")
+        return None
+    
+    cmd = (Qail.get("destinations")
+           .columns(["id", "name", "slug", "is_active"])
+           .order_by("name")
+           .limit(10))
+    
+    # Encode once: full-depth batch plus remainder
+    full_batches, rest = divmod(NUM_QUERIES, PIPELINE_DEPTH)
+    prep = driver.prepare_uniform(cmd, PIPELINE_DEPTH)
+    prep_rest = driver.prepare_uniform(cmd, rest) if rest else None
+    
+    # Warmup
+    await driver.execute_prepared(prep)
+    
+    # Benchmark - same query, PIPELINE_DEPTH per round-trip
+    start = time.perf_counter()
+    for _ in range(full_batches):
+        results = await driver.execute_prepared(prep)
+    if prep_rest:
+        results = await driver.execute_prepared(prep_rest)
+    elapsed = time.perf_counter() - start
+    
+    await driver.close()
+    
+    qps = NUM_QUERIES / elapsed
+    return ("qail AsyncPgDriver pipe", qps, elapsed)
+
+async def bench_asyncpg_concurrent():
+    """Benchmark asyncpg with CONCURRENCY pooled connections"""
+    elapsed = await time_asyncpg_concurrent(
+        dict(host=DB_HOST, port=DB_PORT, user=DB_USER, database=DB_NAME, **ASYNCPG_OPTIONS),
+        QUERY_SQL, CONCURRENCY, NUM_QUERIES,
+    )
+    if elapsed is None:
+        return None
+    
+    qps = NUM_QUERIES / elapsed
+    return (f"asyncpg x{CONCURRENCY}", qps, elapsed)
+
+async def bench_qail_pyo3_concurrent():
+    """Benchmark qail PyO3 driver with CONCURRENCY connections on threads"""
+    try:
+        from qail import Qail
+    except ImportError as e:
+        print(f"  qail not installed, skipping PyO3 test: {e}")
+        return None
+    
+    def make_cmd():
+        return (Qail.get("destinations")
+                .columns(["id", "name", "slug", "is_active"])
+                .order_by("name")
+                .limit(10))
+    
+    elapsed = await time_pyo3_concurrent(
+        (DB_HOST, DB_PORT, DB_USER, DB_NAME, ""), make_cmd, CONCURRENCY, NUM_QUERIES,
+    )
+    
+    qps = NUM_QUERIES / elapsed
+    return (f"qail PyO3 x{CONCURRENCY}", qps, elapsed)
+
+async def bench_qail_async_concurrent():
+    """Benchmark qail AsyncPgDriver with CONCURRENCY connections"""
+    try:
+        from qail import AsyncPgDriver, Qail
+    except ImportError as e:
+        print(f"  qail AsyncPgDriver not available, skipping: {e}")
+        return None
+    
+    try:
+        drivers = [
+            await AsyncPgDriver.connect(DB_HOST, DB_PORT, DB_USER, DB_NAME, DB_PASS)
+            for _ in range(CONCURRENCY)
+        ]
+    except Exception as e:
+        print(f"  AsyncPgDriver connection failed: {e}")
+        return None
+    
+    def make_cmd():
+        return (Qail.get("destinations")
+                .columns(["id", "name", "slug", "is_active"])
+                .order_by("name")
+                .limit(10))
+    
+    # AsyncPgDriver reads one response at a time: one query per connection
+    fetchers = [lambda d=d: d.fetch_all(make_cmd()) for d in drivers]
+    
+    # Warmup
+    await run_concurrent(fetchers, 100)
+    
+    # Benchmark
+    start = time.perf_counter()
+    await run_concurrent(fetchers, NUM_QUERIES)
+    elapsed = time.perf_counter() - start
+    
+    for d in drivers:
+        await d.close()
+    
+    qps = NUM_QUERIES / elapsed
+    return (f"qail AsyncPgDriver x{CONCURRENCY}", qps, elapsed)
+
 async def main():
     print("=" * 60)
     print("Fair Sequential Query Benchmark")
     print(f"Query: SELECT id, name, slug, is_active FROM destinations")
     print(f"Queries: {NUM_QUERIES} sequential (same query repeated)")
     print(f"Database: {DB_NAME}")
+    print(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
     print("=" * 60)
     print()
     
@@ -155,10 +311,28 @@ async def main():
         results.append(r)
         print(f"  {r[0]}: {r[1]:,.0f} q/s ({r[2]*1000:.1f}ms total)")
     
+    print(f"Testing qail AsyncPgDriver (pipelined x{PIPELINE_DEPTH})...")
+    r = await bench_qail_async_pipelined()
+    if r:
+        results.append(r)
+        print(f"  {r[0]}: {r[1]:,.0f} q/s ({r[2]*1000:.1f}ms total)")
+    
+    # Concurrent mode
+    for label, bench in (
+        ("asyncpg", bench_asyncpg_concurrent),
+        ("qail PyO3", bench_qail_pyo3_concurrent),
+        ("qail AsyncPgDriver", bench_qail_async_concurrent),
+    ):
+        print(f"Testing {label} (concurrent x{CONCURRENCY})...")
+        r = await bench()
+        if r:
+            results.append(r)
+            print(f"  {r[0]}: {r[1]:,.0f} q/s ({r[2]*1000:.1f}ms total)")
+    
     # Summary
     print()
     print("=" * 60)
-    print("RESULTS (Sequential Mode - Single Connection)")
+    print(f"RESULTS (Sequential: 1 connection, xN: {CONCURRENCY} connections)")
     print("=" * 60)
     
     if results:
@@ -169,7 +343,10 @@ async def main():
         for name, qps, elapsed in results:
             ratio = qps / baseline if baseline else 0
             avg_latency = (elapsed / NUM_QUERIES) * 1000  # ms per query
-            print(f"{name:25s} {qps:>10,.0f} q/s  {avg_latency:.3f}ms/query  ({ratio:.1f}x vs asyncpg)")
+            print(f"{name:28s} {qps:>10,.0f} q/s  {avg_latency:.3f}ms/query  ({ratio:.1f}x vs asyncpg)")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -6,10 +6,26 @@ Tests:
 2. QailCmd building time
 3. Encoding time (PyO3 encode_cmd)
 4. Network I/O time
+
+Runs under uvloop when installed (pip install uvloop).
 """
 
 import asyncio
+import statistics
 import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+try:
+    import uvloop  # Optional: pip install uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 DB_HOST = 'localhost'
 DB_PORT = 5432
@@ -18,6 +34,21 @@ DB_NAME = 'swb_staging_local'
 
 NUM_ITERATIONS = 10000
 
+def alloc_timings(n):
+    """Preallocated per-iteration latency buffer (ns), shared across benches"""
+    if np is not None:
+        return np.empty(n, dtype='f8')
+    return array('d', bytes(8 * n))
+
+def print_percentiles(timings):
+    """Print p50/p95/p99 latency of a filled timings buffer"""
+    if np is not None:
+        p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    else:
+        cuts = statistics.quantiles(timings, n=100)
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    print(f"  p50 {p50 / 1000:.2f} µs  p95 {p95 / 1000:.2f} µs  p99 {p99 / 1000:.2f} µs")
+
 def profile_cmd_building():
     """Measure time to build Qail (Python → Rust)"""
     from qail import Qail, Operator
@@ -36,9 +67,9 @@ def profile_cmd_building():
     print(f"Qail building:        {ops_per_sec:>10,.0f} ops/s  ({us_per_op:.2f} µs/op)")
     return elapsed
 
-def bench_encoding():
+def profile_encoding():
     """Measure time to encode Qail to wire bytes"""
-    from qail import Qail, encode_cmd
+    from qail import Qail, Operator, encode_cmd
     
     # Pre-build cmd
     cmd = (Qail.get("destinations")
@@ -75,35 +106,35 @@ def profile_build_plus_encode():
     print(f"Build + Encode:       {ops_per_sec:>10,.0f} ops/s  ({us_per_op:.2f} µs/op)")
     return elapsed
 
-async def profile_asyncpg_query():
+async def profile_asyncpg_query(pool, timings):
     """Measure pure asyncpg query time (baseline)"""
-    import asyncpg
-    
-    conn = await asyncpg.connect(host=DB_HOST, port=DB_PORT, user=DB_USER, database=DB_NAME)
-    
-    sql = "SELECT id, name, slug, is_active FROM destinations ORDER BY name LIMIT 10"
-    
-    # Warmup
-    for _ in range(100):
-        await conn.fetch(sql)
-    
-    start = time.perf_counter()
-    for _ in range(NUM_ITERATIONS):
-        rows = await conn.fetch(sql)
-    elapsed = time.perf_counter() - start
-    
-    await conn.close()
+    async with pool.acquire() as conn:
+        # Prepare once: the loop measures bind/execute, not statement lookup
+        stmt = await conn.prepare(
+            "SELECT id, name, slug, is_active FROM destinations ORDER BY name LIMIT 10"
+        )
+        
+        # Warmup
+        for _ in range(100):
+            await stmt.fetch()
+        
+        start = t0 = time.perf_counter_ns()
+        for i in range(NUM_ITERATIONS):
+            rows = await stmt.fetch()
+            t1 = time.perf_counter_ns()
+            timings[i] = t1 - t0
+            t0 = t1
+        elapsed = (t0 - start) / 1e9
     
     ops_per_sec = NUM_ITERATIONS / elapsed
     us_per_op = (elapsed / NUM_ITERATIONS) * 1_000_000
     print(f"asyncpg query:        {ops_per_sec:>10,.0f} ops/s  ({us_per_op:.2f} µs/op)")
+    print_percentiles(timings)
     return elapsed
 
-async def profile_qail_async_driver():
+async def profile_qail_async_driver(driver, timings):
     """Measure qail AsyncPgDriver (Python asyncio + PyO3 encode)"""
-    from qail import AsyncPgDriver, Qail
-    
-    driver = await AsyncPgDriver.connect(DB_HOST, DB_PORT, DB_USER, DB_NAME, None)
+    from qail import Qail
     
     # Pre-build cmd
     cmd = (Qail.get("destinations")
@@ -116,25 +147,57 @@ async def profile_qail_async_driver():
         await driver.fetch_all(cmd)
     
     # Test with pre-built cmd (isolates network time)
-    start = time.perf_counter()
-    for _ in range(NUM_ITERATIONS):
+    start = t0 = time.perf_counter_ns()
+    for i in range(NUM_ITERATIONS):
         rows = await driver.fetch_all(cmd)
-    elapsed = time.perf_counter() - start
-    
-    await driver.close()
+        t1 = time.perf_counter_ns()
+        timings[i] = t1 - t0
+        t0 = t1
+    elapsed = (t0 - start) / 1e9
     
     ops_per_sec = NUM_ITERATIONS / elapsed
     us_per_op = (elapsed / NUM_ITERATIONS) * 1_000_000
     print(f"qail AsyncDriver:     {ops_per_sec:>10,.0f} ops/s  ({us_per_op:.2f} µs/op)")
+    print_percentiles(timings)
     return elapsed
 
-async def profile_qail_pyo3_driver():
-    """Measure qail PyO3 driver (Rust tokio with GIL release)"""
-    from qail import PgDriver, Qail
+async def profile_qail_pyo3_driver(driver, timings):
+    """Measure qail PyO3 driver awaited from the loop (Rust tokio with GIL release)"""
+    from qail import Qail
     
-    driver = await asyncio.to_thread(
-        PgDriver.connect, DB_HOST, DB_PORT, DB_USER, DB_NAME, ""
-    )
+    loop = asyncio.get_running_loop()
+    # One pinned thread and a pre-bound call: no per-query closure or
+    # default-pool scheduling, unlike asyncio.to_thread
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="qail") as executor:
+        # Pre-build cmd
+        cmd = (Qail.get("destinations")
+               .columns(["id", "name", "slug", "is_active"])
+               .order_by("name")
+               .limit(10))
+        call = partial(driver.fetch_all, cmd)
+        
+        # Warmup
+        for _ in range(100):
+            await loop.run_in_executor(executor, call)
+        
+        # Test with pre-built cmd
+        start = t0 = time.perf_counter_ns()
+        for i in range(NUM_ITERATIONS):
+            rows = await loop.run_in_executor(executor, call)
+            t1 = time.perf_counter_ns()
+            timings[i] = t1 - t0
+            t0 = t1
+        elapsed = (t0 - start) / 1e9
+    
+    ops_per_sec = NUM_ITERATIONS / elapsed
+    us_per_op = (elapsed / NUM_ITERATIONS) * 1_000_000
+    print(f"qail PyO3 driver:     {ops_per_sec:>10,.0f} ops/s  ({us_per_op:.2f} µs/op)")
+    print_percentiles(timings)
+    return elapsed
+
+def profile_qail_pyo3_driver_sync(driver, timings):
+    """Measure qail PyO3 driver called directly (no event loop, no thread hop)"""
+    from qail import Qail
     
     # Pre-build cmd
     cmd = (Qail.get("destinations")
@@ -144,23 +207,28 @@ async def profile_qail_pyo3_driver():
     
     # Warmup
     for _ in range(100):
-        await asyncio.to_thread(driver.fetch_all, cmd)
+        driver.fetch_all(cmd)
     
-    # Test with pre-built cmd
-    start = time.perf_counter()
-    for _ in range(NUM_ITERATIONS):
-        rows = await asyncio.to_thread(driver.fetch_all, cmd)
-    elapsed = time.perf_counter() - start
+    # fetch_all blocks with the GIL released; nothing else needs the loop
+    start = t0 = time.perf_counter_ns()
+    for i in range(NUM_ITERATIONS):
+        rows = driver.fetch_all(cmd)
+        t1 = time.perf_counter_ns()
+        timings[i] = t1 - t0
+        t0 = t1
+    elapsed = (t0 - start) / 1e9
     
     ops_per_sec = NUM_ITERATIONS / elapsed
     us_per_op = (elapsed / NUM_ITERATIONS) * 1_000_000
-    print(f"qail PyO3 driver:     {ops_per_sec:>10,.0f} ops/s  ({us_per_op:.2f} µs/op)")
+    print(f"qail PyO3 (sync):     {ops_per_sec:>10,.0f} ops/s  ({us_per_op:.2f} µs/op)")
+    print_percentiles(timings)
     return elapsed
 
 async def main():
     print("=" * 60)
     print("QAIL Python Driver Profiling")
     print(f"Iterations: {NUM_ITERATIONS:,}")
+    print(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
     print("=" * 60)
     print()
     
@@ -171,9 +239,26 @@ async def main():
     print()
     
     print("--- Full query (including network) ---")
-    t_asyncpg = await profile_asyncpg_query()
-    t_async = await profile_qail_async_driver()
-    t_pyo3 = await profile_qail_pyo3_driver()
+    import asyncpg
+    from qail import AsyncPgDriver, PgDriver
+    
+    # Connect everything up front so no profile pays handshake cost
+    pool = await asyncpg.create_pool(
+        host=DB_HOST, port=DB_PORT, user=DB_USER, database=DB_NAME,
+        min_size=1, max_size=1,
+    )
+    async_driver = await AsyncPgDriver.connect(DB_HOST, DB_PORT, DB_USER, DB_NAME, None)
+    pyo3_driver = PgDriver.connect(DB_HOST, DB_PORT, DB_USER, DB_NAME, "")
+    
+    # One buffer for all network benches; each overwrites it in full
+    timings = alloc_timings(NUM_ITERATIONS)
+    t_asyncpg = await profile_asyncpg_query(pool, timings)
+    t_async = await profile_qail_async_driver(async_driver, timings)
+    t_pyo3 = await profile_qail_pyo3_driver(pyo3_driver, timings)
+    t_pyo3_sync = profile_qail_pyo3_driver_sync(pyo3_driver, timings)
+    
+    await async_driver.close()
+    await pool.close()
     print()
     
     print("=" * 60)
@@ -187,6 +272,7 @@ async def main():
     asyncpg_us = (t_asyncpg / NUM_ITERATIONS) * 1_000_000
     async_us = (t_async / NUM_ITERATIONS) * 1_000_000
     pyo3_us = (t_pyo3 / NUM_ITERATIONS) * 1_000_000
+    pyo3_sync_us = (t_pyo3_sync / NUM_ITERATIONS) * 1_000_000
     build_encode_us = (t_both / NUM_ITERATIONS) * 1_000_000
     
     print(f"Time breakdown per query:")
@@ -194,9 +280,14 @@ async def main():
     print(f"  qail build+encode:  {build_encode_us:.2f} µs")
     print(f"  qail AsyncDriver:   {async_us:.2f} µs ({async_us - asyncpg_us:+.2f} µs vs asyncpg)")
     print(f"  qail PyO3 driver:   {pyo3_us:.2f} µs ({pyo3_us - asyncpg_us:+.2f} µs vs asyncpg)")
+    print(f"  qail PyO3 (sync):   {pyo3_sync_us:.2f} µs ({pyo3_sync_us - asyncpg_us:+.2f} µs vs asyncpg)")
     print()
     print(f"Overhead sources:")
     print(f"  Build+Encode takes: {build_encode_us:.2f} µs ({build_encode_us/async_us*100:.1f}% of AsyncDriver query)")
+    print(f"  Thread hop:         {pyo3_us - pyo3_sync_us:.2f} µs per PyO3 query")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -8,18 +8,127 @@ Possible culprits:
 1. Python row parsing (_parse_data_row, _parse_row_description)
 2. Row object creation
 3. encode_cmd() being called per query instead of reusing
+
+Runs under uvloop when installed (pip install uvloop).
 """
 
 import asyncio
+import socket
+import sys
 import time
 import struct
 
+try:
+    import uvloop  # Optional: pip install uvloop
+except ImportError:
+    uvloop = None
+
 DB_HOST = 'localhost'
 DB_PORT = 5432
 DB_USER = 'orion'
 DB_NAME = 'swb_staging_local'
 
 NUM_ITERATIONS = 10000
+READ_SIZE = 65536
+
+# Also measure blocking sendall/recv_into on a plain socket (bypasses the event loop)
+SYSCALL_FLOOR = "--syscall-floor" in sys.argv
+
+_U32 = struct.Struct('>I')
+_PROTOCOL_V3 = 196608
+
+def _startup_message() -> bytearray:
+    """StartupMessage for DB_USER / DB_NAME, length and version packed in place"""
+    params = f"user\x00{DB_USER}\x00database\x00{DB_NAME}\x00\x00".encode('utf-8')
+    msg = bytearray(8) + params
+    _U32.pack_into(msg, 0, len(msg))
+    _U32.pack_into(msg, 4, _PROTOCOL_V3)
+    return msg
+
+async def _read_until_ready(reader: asyncio.StreamReader, buf: bytearray):
+    """Read through the next ReadyForQuery with one read() per chunk.
+    
+    Messages are skipped in place instead of two readexactly() awaits per
+    message; bytes past ReadyForQuery stay in `buf` for the next call.
+    """
+    off = 0
+    while True:
+        size = len(buf)
+        while size - off >= 5:
+            end = off + 1 + _U32.unpack_from(buf, off + 1)[0]
+            if end > size:
+                break
+            if buf[off] == 0x5A:  # 'Z' ReadyForQuery
+                del buf[:end]
+                return
+            off = end
+        chunk = await reader.read(READ_SIZE)
+        if not chunk:
+            raise ConnectionError("Server closed the connection")
+        buf += chunk
+
+def _recv_until_ready(sock: socket.socket, buf: bytearray):
+    """Blocking twin of _read_until_ready: recv_into `buf`, skip messages in place.
+    
+    Queries run one at a time, so nothing follows ReadyForQuery and the
+    buffer is empty again on return.
+    """
+    off = end = 0
+    while True:
+        while end - off >= 5:
+            msg_end = off + 1 + _U32.unpack_from(buf, off + 1)[0]
+            if msg_end > end:
+                break
+            if buf[off] == 0x5A:  # 'Z' ReadyForQuery
+                return
+            off = msg_end
+        # Keep only the partial message, then read after it
+        if off:
+            buf[:end - off] = buf[off:end]
+            end -= off
+            off = 0
+        if end == len(buf):
+            buf.extend(bytes(READ_SIZE))
+        n = sock.recv_into(memoryview(buf)[end:])
+        if not n:
+            raise ConnectionError("Server closed the connection")
+        end += n
+
+def profile_syscall_floor():
+    """Measure blocking sendall + recv_into: the pure-syscall floor, no event loop"""
+    from qail import Qail, encode_cmd
+    
+    sock = socket.create_connection((DB_HOST, DB_PORT))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    sock.sendall(_startup_message())
+    
+    buf = bytearray(READ_SIZE)  # Reused for every response
+    _recv_until_ready(sock, buf)
+    
+    cmd = (Qail.get("destinations")
+           .columns(["id", "name", "slug", "is_active"])
+           .order_by("name")
+           .limit(10))
+    wire_bytes = encode_cmd(cmd)  # Encode ONCE
+    
+    # Warmup
+    for _ in range(100):
+        sock.sendall(wire_bytes)
+        _recv_until_ready(sock, buf)
+    
+    start = time.perf_counter()
+    for _ in range(NUM_ITERATIONS):
+        sock.sendall(wire_bytes)
+        _recv_until_ready(sock, buf)
+    elapsed = time.perf_counter() - start
+    
+    sock.close()
+    
+    ops_per_sec = NUM_ITERATIONS / elapsed
+    us_per_op = (elapsed / NUM_ITERATIONS) * 1_000_000
+    print(f"Syscall floor:        {ops_per_sec:>10,.0f} ops/s  ({us_per_op:.2f} µs/op)")
+    return elapsed
 
 async def profile_raw_socket_query():
     """Measure raw socket I/O without AsyncPgDriver overhead"""
@@ -29,20 +138,12 @@ async def profile_raw_socket_query():
     reader, writer = await asyncio.open_connection(DB_HOST, DB_PORT)
     
     # Startup
-    params = f"user\x00{DB_USER}\x00database\x00{DB_NAME}\x00\x00".encode('utf-8')
-    length = 4 + 4 + len(params)
-    startup = struct.pack('>I', length) + struct.pack('>I', 196608) + params
-    writer.write(startup)
+    writer.write(_startup_message())
     await writer.drain()
     
     # Read until ReadyForQuery
-    while True:
-        header = await reader.readexactly(5)
-        msg_type = header[0:1]
-        length = struct.unpack('>I', header[1:5])[0] - 4
-        data = await reader.readexactly(length) if length > 0 else b''
-        if msg_type == b'Z':
-            break
+    buf = bytearray()  # Reused for every response
+    await _read_until_ready(reader, buf)
     
     # Pre-build and pre-encode cmd
     cmd = (Qail.get("destinations")
@@ -55,28 +156,15 @@ async def profile_raw_socket_query():
     for _ in range(100):
         writer.write(wire_bytes)
         await writer.drain()
-        # Read response
-        while True:
-            header = await reader.readexactly(5)
-            msg_type = header[0:1]
-            length = struct.unpack('>I', header[1:5])[0] - 4
-            data = await reader.readexactly(length) if length > 0 else b''
-            if msg_type == b'Z':
-                break
+        await _read_until_ready(reader, buf)
     
     # Benchmark - raw socket with NO parsing
     start = time.perf_counter()
     for _ in range(NUM_ITERATIONS):
         writer.write(wire_bytes)
         await writer.drain()
-        # Read response (no parsing)
-        while True:
-            header = await reader.readexactly(5)
-            msg_type = header[0:1]
-            length = struct.unpack('>I', header[1:5])[0] - 4
-            data = await reader.readexactly(length) if length > 0 else b''
-            if msg_type == b'Z':
-                break
+        # Read response (framing only, no parsing)
+        await _read_until_ready(reader, buf)
     elapsed = time.perf_counter() - start
     
     writer.close()
@@ -88,58 +176,46 @@ async def profile_raw_socket_query():
     return elapsed
 
 async def profile_raw_socket_encode_each():
-    """Same as above but encode each time"""
-    from qail import Qail, encode_cmd
+    """Same as above but encode each time (into a reused buffer, like AsyncPgDriver)"""
+    from qail import Qail, encode_cmd_into
     
     reader, writer = await asyncio.open_connection(DB_HOST, DB_PORT)
     
     # Startup  
-    params = f"user\x00{DB_USER}\x00database\x00{DB_NAME}\x00\x00".encode('utf-8')
-    length = 4 + 4 + len(params)
-    startup = struct.pack('>I', length) + struct.pack('>I', 196608) + params
-    writer.write(startup)
+    writer.write(_startup_message())
     await writer.drain()
     
-    while True:
-        header = await reader.readexactly(5)
-        msg_type = header[0:1]
-        length = struct.unpack('>I', header[1:5])[0] - 4
-        data = await reader.readexactly(length) if length > 0 else b''
-        if msg_type == b'Z':
-            break
+    buf = bytearray()  # Reused for every response
+    await _read_until_ready(reader, buf)
     
     # Pre-build cmd (but encode each time)
     cmd = (Qail.get("destinations")
            .columns(["id", "name", "slug", "is_active"])
            .order_by("name")
            .limit(10))
+    scratch = bytearray(4096)
+    
+    def write_cmd():
+        """Same as AsyncPgDriver._write_cmd"""
+        nonlocal scratch
+        n = encode_cmd_into(cmd, scratch)
+        writer.write(memoryview(scratch)[:n])
+        if writer.transport.get_write_buffer_size():
+            # Transport may keep a view of the unsent tail: don't reuse it
+            scratch = bytearray(len(scratch))
     
     # Warmup
     for _ in range(100):
-        wire_bytes = encode_cmd(cmd)  # Encode each time
-        writer.write(wire_bytes)
+        write_cmd()  # Encode each time
         await writer.drain()
-        while True:
-            header = await reader.readexactly(5)
-            msg_type = header[0:1]
-            length = struct.unpack('>I', header[1:5])[0] - 4
-            data = await reader.readexactly(length) if length > 0 else b''
-            if msg_type == b'Z':
-                break
+        await _read_until_ready(reader, buf)
     
     # Benchmark - encode every time
     start = time.perf_counter()
     for _ in range(NUM_ITERATIONS):
-        wire_bytes = encode_cmd(cmd)
-        writer.write(wire_bytes)
+        write_cmd()
         await writer.drain()
-        while True:
-            header = await reader.readexactly(5)
-            msg_type = header[0:1]
-            length = struct.unpack('>I', header[1:5])[0] - 4
-            data = await reader.readexactly(length) if length > 0 else b''
-            if msg_type == b'Z':
-                break
+        await _read_until_ready(reader, buf)
     elapsed = time.perf_counter() - start
     
     writer.close()
@@ -154,6 +230,7 @@ async def main():
     print("=" * 60)
     print("Deep Profiling: Where is the 15µs overhead?")
     print(f"Iterations: {NUM_ITERATIONS:,}")
+    print(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
     print("=" * 60)
     print()
     
@@ -162,15 +239,19 @@ async def main():
     
     # Baseline asyncpg
     conn = await asyncpg.connect(host=DB_HOST, port=DB_PORT, user=DB_USER, database=DB_NAME)
+    stmt = await conn.prepare("SELECT id, name, slug, is_active FROM destinations ORDER BY name LIMIT 10")
     for _ in range(100):  # warmup
-        await conn.fetch("SELECT id, name, slug, is_active FROM destinations ORDER BY name LIMIT 10")
+        await stmt.fetch()
     start = time.perf_counter()
     for _ in range(NUM_ITERATIONS):
-        await conn.fetch("SELECT id, name, slug, is_active FROM destinations ORDER BY name LIMIT 10")
+        await stmt.fetch()
     t_asyncpg = time.perf_counter() - start
     await conn.close()
     print(f"asyncpg:              {NUM_ITERATIONS/t_asyncpg:>10,.0f} ops/s  ({t_asyncpg/NUM_ITERATIONS*1_000_000:.2f} µs/op)")
     
+    # Blocking socket, no event loop (opt-in)
+    t_floor = profile_syscall_floor() if SYSCALL_FLOOR else None
+    
     # Raw socket - no parsing (pure network)
     t_raw = await profile_raw_socket_query()
     
@@ -202,6 +283,10 @@ async def main():
     async_us = t_async / NUM_ITERATIONS * 1_000_000
     asyncpg_us = t_asyncpg / NUM_ITERATIONS * 1_000_000
     
+    if t_floor is not None:
+        floor_us = t_floor / NUM_ITERATIONS * 1_000_000
+        print(f"Syscall floor:        {floor_us:.2f} µs")
+        print(f"+ asyncio streams:    {raw_us - floor_us:+.2f} µs (total: {raw_us:.2f} µs)")
     print(f"Pure network I/O:     {raw_us:.2f} µs")
     print(f"+ encode_cmd each:    {raw_enc_us - raw_us:+.2f} µs (total: {raw_enc_us:.2f} µs)")
     print(f"+ AsyncPgDriver:      {async_us - raw_enc_us:+.2f} µs (total: {async_us:.2f} µs) ← ROW PARSING OVERHEAD")
@@ -210,4 +295,7 @@ async def main():
     print(f"Gap vs asyncpg:       {async_us - asyncpg_us:+.2f} µs")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
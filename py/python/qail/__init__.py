@@ -30,7 +30,7 @@ Usage:
 from .qail import Qail, PgDriver, Operator, Row
 
 # Sync encoder functions (for native Python async driver)
-from .qail import encode_cmd, encode_batch
+from .qail import encode_cmd, encode_cmd_into, encode_batch
 
 # Pure Python async driver (faster - no Tokio bridge)
 from .driver import PgDriver as AsyncPgDriver
@@ -39,6 +39,6 @@ __all__ = [
     "Qail", "Operator", "Row",
     "PgDriver",        # Tokio-based (backward compat)
     "AsyncPgDriver",   # Native asyncio (faster)
-    "encode_cmd", "encode_batch",
+    "encode_cmd", "encode_cmd_into", "encode_batch",
 ]
 __version__ = "0.9.6"
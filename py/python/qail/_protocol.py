@@ -0,0 +1,35 @@
+"""
+PostgreSQL wire-protocol helpers shared by the pure Python drivers.
+
+Kept free of encoder imports so both driver.py (PyO3 encoder) and
+native_driver.py (ctypes encoder) can use it.
+"""
+
+import struct
+
+_U32 = struct.Struct('>I')
+
+# Describe (unnamed portal): spliced into uniform batches for a RowDescription
+_DESCRIBE_PORTAL = b'D' + _U32.pack(6) + b'P\x00'
+
+
+def tag_row_count(tag: bytes) -> int:
+    """Row count from a CommandComplete tag (b'SELECT 5\\x00' -> 5), 0 if none.
+    
+    The count is always the last word, so b'INSERT 0 5' also gives 5.
+    """
+    last = tag.rstrip(b'\x00').rpartition(b' ')[2]
+    return int(last) if last.isdigit() else 0
+
+
+def describe_first(wire: bytes) -> bytes:
+    """Copy of wire with a Describe after the first statement's Parse + Bind.
+    
+    Batch encoders emit no Describe, so without this rows of a uniform
+    batch get no column names (and no OID-based decoders). Every statement
+    is identical, so one RowDescription covers the whole batch.
+    """
+    pos = 0
+    for _ in range(2):  # Parse, Bind
+        pos += 1 + _U32.unpack_from(wire, pos + 1)[0]
+    return b''.join((wire[:pos], _DESCRIBE_PORTAL, wire[pos:]))
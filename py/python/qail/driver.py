@@ -8,7 +8,8 @@ This eliminates the Tokio bridge overhead.
 import asyncio
 import struct
 from typing import Optional
-from . import Qail, encode_cmd, encode_batch
+from . import Qail, encode_cmd_into, encode_batch
+from ._protocol import describe_first, tag_row_count
 
 
 def _encode_startup(user: str, database: str) -> bytes:
@@ -21,12 +22,18 @@ def _encode_startup(user: str, database: str) -> bytes:
 
 
 class Row:
-    """Row from query result."""
+    """Row from query result.
+    
+    Holds raw column bytes only; type conversion happens in to_dict and
+    the name index is built on first access by name.
+    """
+    
+    __slots__ = ("_columns", "_names", "_name_to_idx")
     
     def __init__(self, columns: list[Optional[bytes]], names: list[str]):
         self._columns = columns
         self._names = names
-        self._name_to_idx = {n: i for i, n in enumerate(names)}
+        self._name_to_idx: Optional[dict[str, int]] = None
     
     def get(self, index: int) -> Optional[bytes]:
         """Get column value by index."""
@@ -36,7 +43,10 @@ class Row:
     
     def get_by_name(self, name: str) -> Optional[bytes]:
         """Get column value by name."""
-        idx = self._name_to_idx.get(name)
+        name_to_idx = self._name_to_idx
+        if name_to_idx is None:
+            name_to_idx = self._name_to_idx = {n: i for i, n in enumerate(self._names)}
+        idx = name_to_idx.get(name)
         if idx is not None:
             return self._columns[idx]
         return None
@@ -44,8 +54,7 @@ class Row:
     def to_dict(self) -> dict:
         """Convert row to dict with automatic type conversion."""
         result = {}
-        for name, idx in self._name_to_idx.items():
-            val = self._columns[idx]
+        for name, val in zip(self._names, self._columns):
             if val is None:
                 result[name] = None
             else:
@@ -77,6 +86,19 @@ class Row:
         return f"Row({len(self._columns)} columns)"
 
 
+class PreparedUniform:
+    """Pre-encoded batch of `count` identical commands (see prepare_uniform)."""
+    
+    __slots__ = ("wire_bytes", "count")
+    
+    def __init__(self, wire_bytes: bytes, count: int):
+        self.wire_bytes = wire_bytes
+        self.count = count
+    
+    def __repr__(self):
+        return f"PreparedUniform({self.count} queries, {len(self.wire_bytes)} bytes)"
+
+
 class PgDriver:
     """
     Pure Python async PostgreSQL driver.
@@ -87,6 +109,8 @@ class PgDriver:
     def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         self._reader = reader
         self._writer = writer
+        # Reused output buffer for encode_cmd_into (grown by the encoder)
+        self._scratch = bytearray(4096)
     
     @classmethod
     async def connect(
@@ -150,11 +174,52 @@ class PgDriver:
     
     async def fetch_all(self, cmd: Qail) -> list[Row]:
         """Execute query and fetch all rows."""
-        wire_bytes = encode_cmd(cmd)  # Returns PyBytes directly
-        self._writer.write(wire_bytes)
+        self._write_cmd(cmd)
         await self._writer.drain()
         return await self._read_rows()
     
+    async def fetch_count(self, cmd: Qail) -> int:
+        """Execute query and return its row count without parsing rows."""
+        self._write_cmd(cmd)
+        await self._writer.drain()
+        
+        count = 0
+        while True:
+            msg_type, data = await self._recv_msg()
+            if msg_type == b'C':  # CommandComplete: b'SELECT n\x00'
+                count = tag_row_count(data)
+            elif msg_type == b'Z':  # ReadyForQuery
+                break
+            elif msg_type == b'E':  # ErrorResponse
+                raise RuntimeError(f"Query error: {data}")
+        return count
+    
+    def _write_cmd(self, cmd: Qail):
+        """Encode into the scratch buffer and write it (no per-call bytes)."""
+        n = encode_cmd_into(cmd, self._scratch)
+        self._writer.write(memoryview(self._scratch)[:n])
+        if self._writer.transport.get_write_buffer_size():
+            # Transport may keep a view of the unsent tail: don't reuse it
+            self._scratch = bytearray(len(self._scratch))
+    
+    async def fetch_many(self, cmd: Qail, count: int) -> list[list[Row]]:
+        """Execute the same command `count` times in single round-trip.
+        
+        Returns one row list per execution, named like fetch_all rows.
+        """
+        return await self.execute_prepared(self.prepare_uniform(cmd, count))
+    
+    def prepare_uniform(self, cmd: Qail, count: int) -> PreparedUniform:
+        """Encode `count` copies of a hot command once, for execute_prepared."""
+        # One Describe for the batch: all statements share its RowDescription
+        return PreparedUniform(describe_first(encode_batch([cmd] * count)), count)
+    
+    async def execute_prepared(self, prepared: PreparedUniform) -> list[list[Row]]:
+        """Send a prepared uniform batch; no encoding in the hot loop."""
+        self._writer.write(prepared.wire_bytes)
+        await self._writer.drain()
+        return await self._read_result_sets()
+    
     async def _read_rows(self) -> list[Row]:
         """Read DataRow messages until ReadyForQuery."""
         rows = []
@@ -181,6 +246,30 @@ class PgDriver:
         
         return rows
     
+    async def _read_result_sets(self) -> list[list[Row]]:
+        """Read pipelined results until ReadyForQuery, split on CommandComplete."""
+        results = []
+        rows = []
+        col_names = []
+        
+        while True:
+            msg_type, data = await self._recv_msg()
+            
+            if msg_type == b'T':  # RowDescription (first statement only)
+                col_names = self._parse_row_description(data)
+            elif msg_type == b'D':  # DataRow
+                columns = self._parse_data_row(data)
+                rows.append(Row(columns, col_names))
+            elif msg_type == b'C':  # CommandComplete
+                results.append(rows)
+                rows = []
+            elif msg_type == b'Z':  # ReadyForQuery
+                break
+            elif msg_type == b'E':  # ErrorResponse
+                raise RuntimeError(f"Batch error: {data}")
+        
+        return results
+    
     def _parse_row_description(self, data: bytes) -> list[str]:
         """Parse RowDescription message."""
         col_count = struct.unpack('>H', data[:2])[0]
@@ -5,30 +5,35 @@ Provides direct access to Rust qail-core encoder without PyO3 overhead.
 """
 
 import ctypes
+import functools
+import importlib.resources
 import os
-from pathlib import Path
+import threading
+
+
+_LIB_NAMES = ("libqail_ffi.dylib", "libqail_ffi.so")
 
 
 def _find_library() -> str:
     """Find the qail-ffi shared library."""
-    # Check common locations
-    candidates = [
+    dev_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), *[".."] * 4)
+    search_dirs = [
         # Development build
-        Path(__file__).parent.parent.parent.parent.parent / "target" / "release" / "libqail_ffi.dylib",
-        Path(__file__).parent.parent.parent.parent.parent / "target" / "release" / "libqail_ffi.so",
-        Path(__file__).parent.parent.parent.parent.parent / "target" / "debug" / "libqail_ffi.dylib",
-        Path(__file__).parent.parent.parent.parent.parent / "target" / "debug" / "libqail_ffi.so",
+        os.path.join(dev_root, "target", "release"),
+        os.path.join(dev_root, "target", "debug"),
         # Installed
-        Path("/usr/local/lib/libqail_ffi.dylib"),
-        Path("/usr/local/lib/libqail_ffi.so"),
+        "/usr/local/lib",
         # Environment variable
-        Path(os.environ.get("QAIL_LIB_PATH", "")) / "libqail_ffi.dylib",
-        Path(os.environ.get("QAIL_LIB_PATH", "")) / "libqail_ffi.so",
+        os.environ.get("QAIL_LIB_PATH", ""),
+        # Wheel install (shipped inside the package)
+        str(importlib.resources.files(__package__)),
     ]
     
-    for path in candidates:
-        if path.exists():
-            return str(path)
+    for directory in search_dirs:
+        for name in _LIB_NAMES:
+            path = os.path.join(directory, name)
+            if os.path.exists(path):
+                return path
     
     raise RuntimeError(
         "Could not find libqail_ffi. Set QAIL_LIB_PATH or build with: "
@@ -167,6 +172,35 @@ def encode_uniform_batch(
     return result
 
 
+@functools.lru_cache(maxsize=1024)
+def _utf8(s: str) -> bytes:
+    """UTF-8 encode, cached for repeated table/column specs."""
+    return s.encode('utf-8')
+
+
+def _cols_spec(columns: list[str] | None) -> bytes:
+    return _utf8("*" if not columns or columns == ["*"] else ",".join(columns))
+
+
+# Per-thread argument arrays for qail_encode_batch_get, grown on demand
+_batch_bufs = threading.local()
+
+
+def _batch_arrays(count: int):
+    """Return reusable (tables, columns, limits) ctypes arrays with capacity >= count."""
+    arrays = getattr(_batch_bufs, "arrays", None)
+    if arrays is None or len(arrays[0]) < count:
+        cap = max(count, 2 * len(arrays[0]) if arrays else 64)
+        arrays = (
+            (ctypes.c_char_p * cap)(),
+            (ctypes.c_char_p * cap)(),
+            (ctypes.c_int64 * cap)(),
+        )
+        _batch_bufs.arrays = arrays
+        _batch_bufs.used = 0
+    return arrays
+
+
 def encode_batch_get(
     queries: list[tuple[str, list[str] | None, int]]
 ) -> bytes:
@@ -183,16 +217,16 @@ def encode_batch_get(
     if count == 0:
         return b""
     
-    # Build arrays
-    tables_arr = (ctypes.c_char_p * count)()
-    cols_arr = (ctypes.c_char_p * count)()
-    limits_arr = (ctypes.c_int64 * count)()
-    
-    for i, (table, columns, limit) in enumerate(queries):
-        tables_arr[i] = table.encode('utf-8')
-        cols_str = "*" if not columns or columns == ["*"] else ",".join(columns)
-        cols_arr[i] = cols_str.encode('utf-8')
-        limits_arr[i] = limit
+    # Fill reusable arrays (slice assignment loops in C)
+    tables_arr, cols_arr, limits_arr = _batch_arrays(count)
+    tables_arr[:count] = [_utf8(q[0]) for q in queries]
+    cols_arr[:count] = [_cols_spec(q[1]) for q in queries]
+    limits_arr[:count] = [q[2] for q in queries]
+    # Clear the tail left by a larger previous batch so its bytes can be freed
+    used = _batch_bufs.used
+    if used > count:
+        tables_arr[count:used] = cols_arr[count:used] = [None] * (used - count)
+    _batch_bufs.used = count
     
     ptr = ctypes.c_void_p()
     length = ctypes.c_size_t()
@@ -6,26 +6,116 @@ This is the high-performance path for Python.
 """
 
 import asyncio
+import socket
 import struct
-from typing import Optional
-from .ffi import encode_get, encode_batch_get
+from collections import OrderedDict, deque
+from typing import Any, Callable, Optional
+from .ffi import encode_get, encode_batch_get, encode_uniform_batch
+from ._protocol import describe_first, tag_row_count
+
+# Max distinct (table, columns, limit, count) queries kept pre-encoded per driver
+ENCODE_CACHE_SIZE = 1024
+
+# Precompiled wire-format readers (unpack_from, no slicing)
+_I4 = struct.Struct('>i')
+_U32 = struct.Struct('>I')
+_H2 = struct.Struct('>H')
+
+# Precompiled wire-format writers
+_MSG_HEADER = struct.Struct('>cI')
+
+# Protocol version 3.0
+_PROTOCOL_V3 = 196608
+
+# Terminate message
+_TERMINATE = _MSG_HEADER.pack(b'X', 4)
+
+# Receive buffer: initial size, and free tail kept available for recv_into
+_RBUF_SIZE = 262144
+_RBUF_MIN_FREE = 16384
+
+# Message type byte -> 1-byte bytes, so framing allocates nothing
+_MSG_TYPES = [bytes([i]) for i in range(256)]
 
 
 def _encode_startup(user: str, database: str) -> bytes:
     """Encode PostgreSQL startup message."""
     params = f"user\x00{user}\x00database\x00{database}\x00\x00"
-    params_bytes = params.encode('utf-8')
-    length = 4 + 4 + len(params_bytes)
-    return struct.pack('>I', length) + struct.pack('>I', 196608) + params_bytes
+    buf = bytearray(8)
+    buf += params.encode('utf-8')
+    _U32.pack_into(buf, 0, len(buf))
+    _U32.pack_into(buf, 4, _PROTOCOL_V3)
+    return bytes(buf)
+
+
+def _encode_password_msg(password: str) -> bytes:
+    buf = bytearray(5)
+    buf[0] = 0x70  # 'p'
+    buf += password.encode('utf-8')
+    buf.append(0)
+    _U32.pack_into(buf, 1, len(buf) - 1)
+    return bytes(buf)
+
+
+def _infer(val: bytes):
+    """Fallback decoder for unknown OIDs: bool, int, float, else str."""
+    s = val.decode('utf-8')
+    if s == 't':
+        return True
+    if s == 'f':
+        return False
+    try:
+        return int(s)
+    except ValueError:
+        try:
+            return float(s)
+        except ValueError:
+            return s
+
+
+def _bool(val: bytes) -> bool:
+    return val == b't'
+
+
+def _utf8(val: bytes) -> str:
+    return val.decode('utf-8')
+
+
+# Text-format decoders by PostgreSQL type OID
+DECODERS: dict[int, Callable[[bytes], Any]] = {
+    16: _bool,      # bool
+    19: _utf8,      # name
+    20: int,        # int8
+    21: int,        # int2
+    23: int,        # int4
+    25: _utf8,      # text
+    26: int,        # oid
+    700: float,     # float4
+    701: float,     # float8
+    1042: _utf8,    # bpchar
+    1043: _utf8,    # varchar
+}
 
 
 class Row:
-    """Row from query result."""
+    """Row from query result.
+    
+    Holds raw column bytes only; decoding happens in to_dict and the
+    name index is built on first access by name.
+    """
+    
+    __slots__ = ("_columns", "_names", "_decoders", "_name_to_idx")
     
-    def __init__(self, columns: list[Optional[bytes]], names: list[str]):
+    def __init__(
+        self,
+        columns: list[Optional[bytes]],
+        names: list[str],
+        decoders: Optional[list[Callable[[bytes], Any]]] = None,
+    ):
         self._columns = columns
         self._names = names
-        self._name_to_idx = {n: i for i, n in enumerate(names)}
+        self._decoders = decoders
+        self._name_to_idx: Optional[dict[str, int]] = None
     
     def get(self, index: int) -> Optional[bytes]:
         if 0 <= index < len(self._columns):
@@ -33,32 +123,20 @@ class Row:
         return None
     
     def get_by_name(self, name: str) -> Optional[bytes]:
-        idx = self._name_to_idx.get(name)
+        name_to_idx = self._name_to_idx
+        if name_to_idx is None:
+            name_to_idx = self._name_to_idx = {n: i for i, n in enumerate(self._names)}
+        idx = name_to_idx.get(name)
         if idx is not None:
             return self._columns[idx]
         return None
     
     def to_dict(self) -> dict:
-        result = {}
-        for name, idx in self._name_to_idx.items():
-            val = self._columns[idx]
-            if val is None:
-                result[name] = None
-            else:
-                s = val.decode('utf-8')
-                if s == 't':
-                    result[name] = True
-                elif s == 'f':
-                    result[name] = False
-                else:
-                    try:
-                        result[name] = int(s)
-                    except ValueError:
-                        try:
-                            result[name] = float(s)
-                        except ValueError:
-                            result[name] = s
-        return result
+        decoders = self._decoders or [_infer] * len(self._names)
+        return {
+            name: dec(raw) if raw is not None else None
+            for name, dec, raw in zip(self._names, decoders, self._columns)
+        }
     
     def __getitem__(self, key):
         if isinstance(key, int):
@@ -69,17 +147,325 @@ class Row:
         return len(self._columns)
 
 
+def _parse_row_description(
+    data: bytes,
+) -> tuple[list[str], list[Callable[[bytes], Any]]]:
+    """Parse column names and per-column decoders (from type OID)."""
+    col_count = _H2.unpack_from(data)[0]
+    names = []
+    decoders = []
+    offset = 2
+    for _ in range(col_count):
+        end = data.index(b'\x00', offset)
+        name = data[offset:end].decode('utf-8')
+        names.append(name)
+        # table OID (4) + attnum (2), then type OID (4)
+        type_oid = _U32.unpack_from(data, end + 1 + 6)[0]
+        decoders.append(DECODERS.get(type_oid, _infer))
+        offset = end + 1 + 18
+    return names, decoders
+
+
+def _parse_data_row(data: bytes) -> list[Optional[bytes]]:
+    col_count = _H2.unpack_from(data)[0]
+    unpack_i4 = _I4.unpack_from
+    columns = []
+    append = columns.append
+    offset = 2
+    for _ in range(col_count):
+        length = unpack_i4(data, offset)[0]
+        offset += 4
+        if length == -1:
+            append(None)
+        else:
+            append(data[offset:offset+length])
+            offset += length
+    return columns
+
+
+def _dispatch_messages(buf: bytearray, pos: int, size: int, pending: deque) -> int:
+    """Dispatch complete messages in buf[pos:size]; returns first unparsed offset."""
+    unpack_u32 = _U32.unpack_from
+    with memoryview(buf) as mv:
+        while size - pos >= 5:
+            end = pos + 1 + unpack_u32(buf, pos + 1)[0]
+            if end > size:
+                break
+            msg_type = _MSG_TYPES[buf[pos]]
+            if pending:  # Else Notice/ParameterStatus between requests
+                if msg_type == b'Z':  # ReadyForQuery
+                    pending.popleft().finish()
+                else:
+                    pending[0].feed(msg_type, bytes(mv[pos + 5:end]))
+            pos = end
+    return pos
+
+
+class _Request:
+    """In-flight request: collects messages until its ReadyForQuery."""
+    
+    __slots__ = ("future", "error")
+    error_label = "Query error"
+    
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+        self.error = None
+    
+    def feed(self, msg_type: bytes, data: bytes):
+        if msg_type == b'E':  # ErrorResponse (server still sends Z after)
+            self.error = RuntimeError(f"{self.error_label}: {data}")
+    
+    def finish(self):
+        if self.future.done():  # Caller cancelled
+            return
+        if self.error is not None:
+            self.future.set_exception(self.error)
+        else:
+            self.future.set_result(self.result())
+    
+    def result(self):
+        return None
+
+
+class _RowsRequest(_Request):
+    """fetch_all: rows of a single statement."""
+    
+    __slots__ = ("names", "decoders", "rows")
+    
+    def __init__(self, future: asyncio.Future):
+        super().__init__(future)
+        self.names = []
+        self.decoders = None
+        self.rows = []
+    
+    def feed(self, msg_type: bytes, data: bytes):
+        if msg_type == b'D':  # DataRow
+            self.rows.append(Row(_parse_data_row(data), self.names, self.decoders))
+        elif msg_type == b'T':  # RowDescription
+            self.names, self.decoders = _parse_row_description(data)
+        else:
+            super().feed(msg_type, data)
+    
+    def result(self) -> list[Row]:
+        return self.rows
+
+
+class _ResultSetsRequest(_Request):
+    """fetch_many: one row list per statement, split on CommandComplete."""
+    
+    __slots__ = ("names", "decoders", "rows", "results")
+    error_label = "Batch error"
+    
+    def __init__(self, future: asyncio.Future):
+        super().__init__(future)
+        self.names = []
+        self.decoders = None
+        self.rows = []
+        self.results = []
+    
+    def feed(self, msg_type: bytes, data: bytes):
+        if msg_type == b'D':  # DataRow
+            self.rows.append(Row(_parse_data_row(data), self.names, self.decoders))
+        elif msg_type == b'T':  # RowDescription (first statement only)
+            self.names, self.decoders = _parse_row_description(data)
+        elif msg_type == b'C':  # CommandComplete
+            self.results.append(self.rows)
+            self.rows = []
+        else:
+            super().feed(msg_type, data)
+    
+    def result(self) -> list[list[Row]]:
+        return self.results
+
+
+class _CountRequest(_Request):
+    """pipeline_batch: number of completed statements."""
+    
+    __slots__ = ("completed",)
+    error_label = "Batch error"
+    
+    def __init__(self, future: asyncio.Future):
+        super().__init__(future)
+        self.completed = 0
+    
+    def feed(self, msg_type: bytes, data: bytes):
+        if msg_type in (b'C', b'n'):  # CommandComplete or NoData
+            self.completed += 1
+        else:
+            super().feed(msg_type, data)
+    
+    def result(self) -> int:
+        return self.completed
+
+
+class _RowCountRequest(_Request):
+    """fetch_count: row count from CommandComplete; DataRows are skipped."""
+    
+    __slots__ = ("count",)
+    
+    def __init__(self, future: asyncio.Future):
+        super().__init__(future)
+        self.count = 0
+    
+    def feed(self, msg_type: bytes, data: bytes):
+        if msg_type == b'C':  # CommandComplete
+            self.count = tag_row_count(data)
+        elif msg_type != b'D':
+            super().feed(msg_type, data)
+    
+    def result(self) -> int:
+        return self.count
+
+
+class _StartupRequest(_Request):
+    """Startup handshake: answers auth requests until ReadyForQuery."""
+    
+    __slots__ = ("transport", "password")
+    error_label = "Auth error"
+    
+    def __init__(self, future: asyncio.Future, transport, password: Optional[str]):
+        super().__init__(future)
+        self.transport = transport
+        self.password = password
+    
+    def feed(self, msg_type: bytes, data: bytes):
+        if msg_type == b'R':  # AuthenticationXXX
+            auth_type = _U32.unpack_from(data)[0]
+            if auth_type == 3 and self.password:  # CleartextPassword
+                self.transport.write(_encode_password_msg(self.password))
+            elif auth_type == 10:  # SASL
+                self._abort(RuntimeError("SCRAM-SHA-256 not implemented. Use trust mode."))
+        elif msg_type == b'E':  # Server closes after auth errors, no Z follows
+            self._abort(RuntimeError(f"{self.error_label}: {data}"))
+    
+    def _abort(self, exc: Exception):
+        if not self.future.done():
+            self.future.set_exception(exc)
+        self.transport.close()
+
+
+class _PgProtocol(asyncio.BufferedProtocol):
+    """
+    Frames backend messages directly from the receive buffer.
+    
+    No StreamReader buffer or reader task: the event loop recv_into()s
+    straight into one preallocated bytearray (no bytes object per read),
+    complete messages are dispatched to the oldest in-flight request, and
+    ReadyForQuery resolves it.
+    """
+    
+    def __init__(self):
+        self.transport = None
+        self.pending: deque[_Request] = deque()
+        self.exc: Optional[BaseException] = None
+        self.paused = False
+        self._rbuf = bytearray(_RBUF_SIZE)
+        self._rstart = 0  # First unparsed byte
+        self._rend = 0    # End of received data
+        loop = asyncio.get_running_loop()
+        self._drain_waiter: Optional[asyncio.Future] = None
+        self._closed = loop.create_future()
+    
+    def connection_made(self, transport):
+        self.transport = transport
+        sock = transport.get_extra_info('socket')
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    def get_buffer(self, sizehint: int) -> memoryview:
+        buf = self._rbuf
+        end = self._rend
+        # Resize only here: the loop still holds the previous view
+        # while buffer_updated runs
+        if len(buf) - end < _RBUF_MIN_FREE:
+            start = self._rstart
+            if start:
+                end -= start
+                buf[:end] = buf[start:self._rend]
+                self._rstart = 0
+                self._rend = end
+            if len(buf) - end < _RBUF_MIN_FREE:
+                buf.extend(bytes(len(buf)))  # Message larger than buffer
+        return memoryview(buf)[end:]
+    
+    def buffer_updated(self, nbytes: int):
+        size = self._rend + nbytes
+        pos = _dispatch_messages(self._rbuf, self._rstart, size, self.pending)
+        
+        # Rewind when drained; partial messages are compacted in get_buffer
+        if pos == size:
+            pos = size = 0
+        self._rstart = pos
+        self._rend = size
+    
+    def connection_lost(self, exc: Optional[Exception]):
+        self.exc = exc or ConnectionError("Connection is closed")
+        pending = self.pending
+        while pending:
+            fut = pending.popleft().future
+            if not fut.done():
+                fut.set_exception(self.exc)
+        self._wake_drain()
+        if not self._closed.done():
+            self._closed.set_result(None)
+    
+    def pause_writing(self):
+        self.paused = True
+    
+    def resume_writing(self):
+        self.paused = False
+        self._wake_drain()
+    
+    def _wake_drain(self):
+        waiter = self._drain_waiter
+        if waiter is not None:
+            self._drain_waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+    
+    async def drain(self):
+        """Wait until the transport drops below its high-water mark."""
+        if self.paused and self.exc is None:
+            if self._drain_waiter is None:
+                self._drain_waiter = asyncio.get_running_loop().create_future()
+            await self._drain_waiter
+    
+    async def wait_closed(self):
+        await self._closed
+
+
+class PreparedUniform:
+    """Pre-encoded batch of `count` identical GET queries (see prepare_uniform)."""
+    
+    __slots__ = ("wire_bytes", "count")
+    
+    def __init__(self, wire_bytes: bytes, count: int):
+        self.wire_bytes = wire_bytes
+        self.count = count
+    
+    def __repr__(self):
+        return f"PreparedUniform({self.count} queries, {len(self.wire_bytes)} bytes)"
+
+
 class NativePgDriver:
     """
     Pure Python async PostgreSQL driver using ctypes FFI.
     
     Uses Rust qail-core via ctypes (no PyO3).
     Python asyncio handles all TCP I/O.
+    
+    Requests are pipelined automatically: each call writes its query and
+    queues a future; the protocol resolves futures in order as
+    ReadyForQuery arrives. Concurrent calls share one connection:
+    
+        rows = await asyncio.gather(*(driver.fetch_all("users") for _ in range(100)))
     """
     
-    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        self._reader = reader
-        self._writer = writer
+    def __init__(self, transport: asyncio.Transport, protocol: _PgProtocol):
+        self._transport = transport
+        self._protocol = protocol
+        # (table, columns, limit) -> wire bytes, LRU-bounded
+        self._encode_cache: OrderedDict[tuple, bytes] = OrderedDict()
     
     @classmethod
     async def connect(
@@ -91,49 +477,34 @@ class NativePgDriver:
         password: Optional[str] = None,
     ) -> "NativePgDriver":
         """Connect to PostgreSQL."""
-        reader, writer = await asyncio.open_connection(host, port)
-        driver = cls(reader, writer)
-        await driver._handshake(user, database, password)
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_connection(_PgProtocol, host, port)
+        driver = cls(transport, protocol)
+        try:
+            await driver._handshake(user, database, password)
+        except BaseException:
+            transport.close()
+            raise
         return driver
     
     async def _handshake(self, user: str, database: str, password: Optional[str]):
         """Perform PostgreSQL startup handshake."""
-        startup = _encode_startup(user, database)
-        self._writer.write(startup)
-        await self._writer.drain()
-        
-        while True:
-            msg_type, data = await self._recv_msg()
-            
-            if msg_type == b'R':  # AuthenticationXXX
-                auth_type = struct.unpack('>I', data[:4])[0]
-                if auth_type == 0:  # AuthenticationOk
-                    pass
-                elif auth_type == 3:  # CleartextPassword
-                    if password:
-                        pwd_msg = self._encode_password_msg(password)
-                        self._writer.write(pwd_msg)
-                        await self._writer.drain()
-                elif auth_type == 10:  # SASL
-                    raise RuntimeError("SCRAM-SHA-256 not implemented. Use trust mode.")
-            elif msg_type == b'K':  # BackendKeyData
-                pass
-            elif msg_type == b'Z':  # ReadyForQuery
-                break
-            elif msg_type == b'E':  # ErrorResponse
-                raise RuntimeError(f"Auth error: {data}")
+        fut = asyncio.get_running_loop().create_future()
+        await self._submit(
+            _encode_startup(user, database),
+            _StartupRequest(fut, self._transport, password),
+        )
     
-    def _encode_password_msg(self, password: str) -> bytes:
-        pwd_bytes = password.encode('utf-8') + b'\x00'
-        length = 4 + len(pwd_bytes)
-        return b'p' + struct.pack('>I', length) + pwd_bytes
-    
-    async def _recv_msg(self) -> tuple[bytes, bytes]:
-        header = await self._reader.readexactly(5)
-        msg_type = header[0:1]
-        length = struct.unpack('>I', header[1:5])[0] - 4
-        data = await self._reader.readexactly(length) if length > 0 else b''
-        return msg_type, data
+    async def _submit(self, wire_bytes: bytes, request: _Request):
+        """Queue request and write its query; resolved by the protocol."""
+        protocol = self._protocol
+        if protocol.exc is not None:
+            raise ConnectionError("Connection is closed") from protocol.exc
+        protocol.pending.append(request)
+        self._transport.write(wire_bytes)
+        if protocol.paused:
+            await protocol.drain()
+        return await request.future
     
     async def fetch_all(
         self, 
@@ -142,60 +513,80 @@ class NativePgDriver:
         limit: int = -1
     ) -> list[Row]:
         """Execute GET query and fetch all rows."""
-        wire_bytes = encode_get(table, columns, limit)
-        self._writer.write(wire_bytes)
-        await self._writer.drain()
-        return await self._read_rows()
-    
-    async def _read_rows(self) -> list[Row]:
-        rows = []
-        col_names = []
-        
-        while True:
-            msg_type, data = await self._recv_msg()
-            
-            if msg_type == b'1':  # ParseComplete
-                pass
-            elif msg_type == b'2':  # BindComplete
-                pass
-            elif msg_type == b'T':  # RowDescription
-                col_names = self._parse_row_description(data)
-            elif msg_type == b'D':  # DataRow
-                columns = self._parse_data_row(data)
-                rows.append(Row(columns, col_names))
-            elif msg_type == b'C':  # CommandComplete
-                pass
-            elif msg_type == b'Z':  # ReadyForQuery
-                break
-            elif msg_type == b'E':  # ErrorResponse
-                raise RuntimeError(f"Query error: {data}")
+        wire_bytes = self._encode_cached(table, columns, limit)
+        fut = asyncio.get_running_loop().create_future()
+        return await self._submit(wire_bytes, _RowsRequest(fut))
+    
+    async def fetch_count(
+        self,
+        table: str,
+        columns: list[str] | None = None,
+        limit: int = -1,
+    ) -> int:
+        """Execute GET query and return its row count without parsing rows."""
+        wire_bytes = self._encode_cached(table, columns, limit)
+        fut = asyncio.get_running_loop().create_future()
+        return await self._submit(wire_bytes, _RowCountRequest(fut))
+    
+    async def fetch_many(
+        self,
+        table: str,
+        columns: list[str] | None = None,
+        limit: int = -1,
+        count: int = 1,
+    ) -> list[list[Row]]:
+        """Execute the same GET query `count` times in single round-trip.
         
-        return rows
-    
-    def _parse_row_description(self, data: bytes) -> list[str]:
-        col_count = struct.unpack('>H', data[:2])[0]
-        names = []
-        offset = 2
-        for _ in range(col_count):
-            end = data.index(b'\x00', offset)
-            name = data[offset:end].decode('utf-8')
-            names.append(name)
-            offset = end + 1 + 18
-        return names
-    
-    def _parse_data_row(self, data: bytes) -> list[Optional[bytes]]:
-        col_count = struct.unpack('>H', data[:2])[0]
-        columns = []
-        offset = 2
-        for _ in range(col_count):
-            length = struct.unpack('>i', data[offset:offset+4])[0]
-            offset += 4
-            if length == -1:
-                columns.append(None)
+        Batch bytes come from encode_uniform_batch and are cached, so
+        repeated calls pay no encoder cost. Returns one row list per query;
+        rows are named and decoded exactly as in fetch_all.
+        """
+        return await self.execute_prepared(
+            self.prepare_uniform(table, columns, limit, count)
+        )
+    
+    def prepare_uniform(
+        self,
+        table: str,
+        columns: list[str] | None = None,
+        limit: int = -1,
+        count: int = 1,
+    ) -> PreparedUniform:
+        """Encode `count` copies of a hot GET query once, for execute_prepared."""
+        wire_bytes = self._encode_cached(table, columns, limit, count)
+        return PreparedUniform(wire_bytes, count)
+    
+    async def execute_prepared(self, prepared: PreparedUniform) -> list[list[Row]]:
+        """Send a prepared uniform batch; no encoding in the hot loop."""
+        fut = asyncio.get_running_loop().create_future()
+        return await self._submit(
+            prepared.wire_bytes, _ResultSetsRequest(fut)
+        )
+    
+    def _encode_cached(
+        self,
+        table: str,
+        columns: list[str] | None,
+        limit: int,
+        count: int = 1,
+    ) -> bytes:
+        """Encode GET query once per distinct (table, columns, limit, count)."""
+        key = (table, tuple(columns) if columns else None, limit, count)
+        cache = self._encode_cache
+        wire_bytes = cache.get(key)
+        if wire_bytes is None:
+            if count == 1:
+                wire_bytes = encode_get(table, columns, limit)
             else:
-                columns.append(data[offset:offset+length])
-                offset += length
-        return columns
+                wire_bytes = describe_first(
+                    encode_uniform_batch(table, columns, limit, count)
+                )
+            cache[key] = wire_bytes
+            if len(cache) > ENCODE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return wire_bytes
     
     async def pipeline_batch(
         self, 
@@ -203,26 +594,12 @@ class NativePgDriver:
     ) -> int:
         """Execute batch of GET queries in single round-trip."""
         wire_bytes = encode_batch_get(queries)
-        self._writer.write(wire_bytes)
-        await self._writer.drain()
-        return await self._read_batch_count(len(queries))
-    
-    async def _read_batch_count(self, expected: int) -> int:
-        completed = 0
-        while True:
-            msg_type, data = await self._recv_msg()
-            if msg_type in (b'C', b'n'):  # CommandComplete or NoData
-                completed += 1
-            elif msg_type == b'Z':  # ReadyForQuery
-                if completed >= expected:
-                    break
-            elif msg_type == b'E':
-                raise RuntimeError(f"Batch error: {data}")
-        return completed
+        fut = asyncio.get_running_loop().create_future()
+        return await self._submit(wire_bytes, _CountRequest(fut))
     
     async def close(self):
         """Close connection."""
-        self._writer.write(b'X\x00\x00\x00\x04')
-        await self._writer.drain()
-        self._writer.close()
-        await self._writer.wait_closed()
+        if self._protocol.exc is None:
+            self._transport.write(_TERMINATE)
+        self._transport.close()
+        await self._protocol.wait_closed()
@@ -7,7 +7,7 @@
 
 use crate::cmd::PyQail;
 use pyo3::prelude::*;
-use pyo3::types::PyBytes;
+use pyo3::types::{PyByteArray, PyBytes};
 use qail_pg::protocol::AstEncoder;
 
 /// Encode a single Qail to PostgreSQL wire protocol bytes.
@@ -18,6 +18,24 @@ pub fn encode_cmd<'py>(py: Python<'py>, cmd: &PyQail) -> Bound<'py, PyBytes> {
     PyBytes::new(py, &wire_bytes)
 }
 
+/// Encode a single Qail into a caller-owned bytearray (grown if too small).
+/// Returns the number of bytes written; send `memoryview(buf)[:n]`.
+/// Skips the per-call PyBytes allocation when the buffer is reused.
+#[pyfunction]
+pub fn encode_cmd_into(cmd: &PyQail, buf: &Bound<'_, PyByteArray>) -> PyResult<usize> {
+    let (wire_bytes, _) = AstEncoder::encode_cmd(&cmd.inner);
+    let n = wire_bytes.len();
+    if n > buf.len() {
+        // Fails with BufferError while a memoryview of buf is alive
+        buf.resize(n)?;
+    }
+    // SAFETY: the GIL is held and no Python code runs while the slice is live.
+    unsafe {
+        buf.as_bytes_mut()[..n].copy_from_slice(&wire_bytes);
+    }
+    Ok(n)
+}
+
 /// Encode multiple Qails to wire bytes for pipeline execution.
 /// All commands in one buffer for single network round-trip.
 #[pyfunction]
@@ -30,6 +48,7 @@ pub fn encode_batch<'py>(py: Python<'py>, cmds: Vec<PyQail>) -> Bound<'py, PyByt
 /// Register encoder functions with the module.
 pub fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(encode_cmd, m)?)?;
+    m.add_function(wrap_pyfunction!(encode_cmd_into, m)?)?;
     m.add_function(wrap_pyfunction!(encode_batch, m)?)?;
     Ok(())
 }